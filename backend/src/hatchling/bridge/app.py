@@ -5,8 +5,14 @@ import pickle
 import sys
 from typing import Any
 
+# The highest protocol supported by every Python version that Hatch itself may run on, since commands
+# are unpickled by the parent process which is not necessarily the same interpreter as the backend
+PICKLE_PROTOCOL = 4
+
 
 class InvokedApplication:
+    __slots__ = ()
+
     def display(self, *args: Any, **kwargs: Any) -> None:
         send_app_command('display', *args, **kwargs)
 
@@ -48,47 +54,59 @@ class Application:
         the capabilities herein and will grant access via an attribute.
     """
 
+    __slots__ = (
+        '__show_error',
+        '__show_info',
+        '__show_warning',
+        '__verbosity',
+    )
+
     def __init__(self) -> None:
         self.__verbosity = int(os.environ.get('HATCH_VERBOSE', '0')) - int(os.environ.get('HATCH_QUIET', '0'))
 
+        # Verbosity is fixed for the lifetime of the application so resolve each gate only once
+        self.__show_info = self.__verbosity >= 0
+        self.__show_warning = self.__verbosity >= -1
+        self.__show_error = self.__verbosity >= -2
+
     def display(self, message: str = '', **kwargs: Any) -> None:
         # Do not document
-        print(message)
+        sys.stdout.write(f'{message}\n')
 
     def display_info(self, message: str = '', **kwargs: Any) -> None:
         """
         Meant to be used for messages conveying basic information.
         """
-        if self.__verbosity >= 0:
-            print(message)
+        if self.__show_info:
+            sys.stdout.write(f'{message}\n')
 
     def display_waiting(self, message: str = '', **kwargs: Any) -> None:
         """
         Meant to be used for messages shown before potentially time consuming operations.
         """
-        if self.__verbosity >= 0:
-            print(message)
+        if self.__show_info:
+            sys.stdout.write(f'{message}\n')
 
     def display_success(self, message: str = '', **kwargs: Any) -> None:
         """
         Meant to be used for messages indicating some positive outcome.
         """
-        if self.__verbosity >= 0:
-            print(message)
+        if self.__show_info:
+            sys.stdout.write(f'{message}\n')
 
     def display_warning(self, message: str = '', **kwargs: Any) -> None:
         """
         Meant to be used for messages conveying important information.
         """
-        if self.__verbosity >= -1:
-            print(message)
+        if self.__show_warning:
+            sys.stdout.write(f'{message}\n')
 
     def display_error(self, message: str = '', **kwargs: Any) -> None:
         """
         Meant to be used for messages indicating some unrecoverable error.
         """
-        if self.__verbosity >= -2:
-            print(message)
+        if self.__show_error:
+            sys.stdout.write(f'{message}\n')
 
     def display_debug(self, message: str = '', level: int = 1, **kwargs: Any) -> None:
         """
@@ -99,18 +117,18 @@ class Application:
             error_message = 'Debug output can only have verbosity levels between 1 and 3 (inclusive)'
             raise ValueError(error_message)
         elif self.__verbosity >= level:
-            print(message)
+            sys.stdout.write(f'{message}\n')
 
     def display_mini_header(self, message: str = '', **kwargs: Any) -> None:
-        if self.__verbosity >= 0:
-            print(f'[{message}]')
+        if self.__show_info:
+            sys.stdout.write(f'[{message}]\n')
 
     def abort(self, message: str = '', code: int = 1, **kwargs: Any) -> None:
         """
         Terminate the program with the given return code.
         """
-        if message and self.__verbosity >= -2:
-            print(message)
+        if message and self.__show_error:
+            sys.stdout.write(f'{message}\n')
 
         sys.exit(code)
 
@@ -119,6 +137,18 @@ class Application:
 
 
 class SafeApplication:
+    __slots__ = (
+        'abort',
+        'display',
+        'display_debug',
+        'display_error',
+        'display_info',
+        'display_mini_header',
+        'display_success',
+        'display_waiting',
+        'display_warning',
+    )
+
     def __init__(self, app: InvokedApplication | Application) -> None:
         self.abort = app.abort
         self.display = app.display
@@ -131,10 +161,10 @@ class SafeApplication:
         self.display_mini_header = app.display_mini_header
 
 
-def format_app_command(method: str, *args: Any, **kwargs: Any) -> str:
-    procedure = pickle.dumps((method, args, kwargs), 4)
+def format_app_command(method: str, *args: Any, **kwargs: Any) -> bytes:
+    procedure = pickle.dumps((method, args, kwargs), PICKLE_PROTOCOL)
 
-    return f"__HATCH__:{''.join('%02x' % i for i in procedure)}"
+    return b'__HATCH__:' + procedure.hex().encode('ascii')
 
 
 def get_application(*, called_by_app: bool) -> InvokedApplication | Application:
@@ -145,5 +175,14 @@ def send_app_command(method: str, *args: Any, **kwargs: Any) -> None:
     _send_app_command(format_app_command(method, *args, **kwargs))
 
 
-def _send_app_command(command: str) -> None:
-    print(command)
+def _send_app_command(command: bytes) -> None:
+    # Streams that are not backed by a binary buffer, such as redirections to `io.StringIO`, receive text
+    buffer = getattr(sys.stdout, 'buffer', None)
+    if buffer is None:
+        sys.stdout.write(f"{command.decode('ascii')}\n")
+        return
+
+    # Flush pending text first so that output ordering is preserved, then emit the command in a single write
+    sys.stdout.flush()
+    buffer.write(command + b'\n')
+    buffer.flush()
@@ -1,40 +1,134 @@
 from __future__ import annotations
 
+import codecs
+import io
 import os
+import platform
 import sys
 from functools import lru_cache
 from importlib import import_module
 from typing import TYPE_CHECKING, Any, Callable, Iterable, cast
 
+from hatch.utils.fs import Path
+
 if TYPE_CHECKING:
     from subprocess import CompletedProcess, Popen
     from types import ModuleType
 
-    from hatch.utils.fs import Path
+
+def normalize_platform_name(platform_name: str) -> str:
+    platform_name = platform_name.lower()
+    return 'macos' if platform_name == 'darwin' else platform_name
+
+
+# Directories protected by System Integrity Protection on macOS and the shells to search for outside of them
+_SIP_PROTECTED = ('/System', '/usr', '/bin', '/sbin', '/var')
+_SHELL_CANDIDATES = ('sh', 'bash', 'zsh', 'fish')
+
+# The platform cannot change during the lifetime of the process
+_PLATFORM_NAME = normalize_platform_name(platform.system())
 
 
-@lru_cache(maxsize=None)
 def get_platform_name() -> str:
-    import platform
+    return _PLATFORM_NAME
 
-    return normalize_platform_name(platform.system())
 
+@lru_cache(maxsize=None)
+def _get_sip_unprotected_path(path_env: str) -> str:
+    """
+    Filter the given `PATH` down to the entries not protected by System Integrity Protection on macOS.
+    The result only depends on the input so it is computed once per distinct value.
+    """
+    unprotected_paths = []
+    for path in path_env.split(os.pathsep):
+        normalized_path = os.path.normpath(path)
+        if not normalized_path.startswith(_SIP_PROTECTED):
+            unprotected_paths.append(path)
+        elif normalized_path.startswith('/usr/local'):
+            unprotected_paths.append(path)
 
-def normalize_platform_name(platform_name: str) -> str:
-    platform_name = platform_name.lower()
-    return 'macos' if platform_name == 'darwin' else platform_name
+    return os.pathsep.join(unprotected_paths)
+
+
+# Successful executable lookups, evicting the oldest entry once full
+_WHICH_CACHE_SIZE = 256
+_which_cache: dict[tuple[str, str, str, str], str] = {}
+
+
+@lru_cache(maxsize=_WHICH_CACHE_SIZE)
+def _depends_on_cwd(executable: str, path: str) -> bool:
+    """
+    Whether the lookup of the given executable may be resolved relative to the current directory.
+    """
+    if os.path.dirname(executable) and not os.path.isabs(executable):
+        return True
+
+    return not all(os.path.isabs(entry) for entry in path.split(os.pathsep))
 
 
 class Platform:
+    __slots__ = (
+        '__default_shell',
+        '__display_func',
+        '__format_for_subprocess',
+        '__modules',
+        '__name',
+        '__populate_default_popen_kwargs',
+        'displaying_status',
+        'format_file_uri',
+        'home',
+        'join_command_args',
+        'linux',
+        'macos',
+        'shlex',
+        'shutil',
+        'subprocess',
+        'windows',
+    )
+
     def __init__(self, display_func: Callable = print) -> None:
         self.__display_func = display_func
 
         # Lazily loaded constants
         self.__default_shell: str | None = None
-        self.__format_file_uri: Callable[[str], str] | None = None
-        self.__join_command_args: Callable[[list[str]], str] | None = None
-        self.__name: str | None = None
-        self.__home: Path | None = None
+
+        # Modules used by the subprocess helpers, these are replaced by the actual modules upon first attribute access
+        self.shlex: ModuleType = _LazyModuleBinding(self, 'shlex')  # type: ignore
+        self.shutil: ModuleType = _LazyModuleBinding(self, 'shutil')  # type: ignore
+        self.subprocess: ModuleType = _LazyModuleBinding(self, 'subprocess')  # type: ignore
+
+        self.__name = get_platform_name()
+
+        # The platform is fixed so these are plain attributes rather than properties
+        self.windows = self.__name == 'windows'
+        """
+        Indicates whether Hatch is running on Windows.
+        """
+        self.macos = self.__name == 'macos'
+        """
+        Indicates whether Hatch is running on macOS.
+        """
+        self.linux = not (self.windows or self.macos)
+        """
+        Indicates whether Hatch is running on neither Windows nor macOS.
+        """
+
+        self.home = Path(os.path.expanduser('~'))
+        """
+        The user's home directory as a path-like object.
+        """
+
+        # Replaced by the resolved implementation upon first call so that no modules are loaded before then
+        self.join_command_args: Callable[[list[str]], str] = self._resolve_join_command_args
+        self.format_file_uri = _format_file_uri_windows if self.windows else _format_file_uri_posix
+
+        # Specialize the helpers used for every subprocess invocation rather than branching on each call
+        self.__format_for_subprocess = (
+            self._format_for_subprocess_windows if self.windows else self._format_for_subprocess_posix
+        )
+        self.__populate_default_popen_kwargs = (
+            self._populate_default_popen_kwargs_macos if self.macos else self._populate_default_popen_kwargs_noop
+        )
 
         # Whether or not an interactive status is being displayed
         self.displaying_status = False
@@ -53,23 +147,7 @@ class Platform:
         """
         Format the given command in a cross-platform manner for immediate consumption by subprocess utilities.
         """
-        if self.windows:
-            # Manually locate executables on Windows to avoid multiple cases in which `shell=True` is required:
-            #
-            # - If the `PATH` environment variable has been modified, see:
-            #   https://github.com/python/cpython/issues/52803
-            # - Executables that do not have the extension `.exe`, see:
-            #   https://docs.microsoft.com/en-us/windows/win32/api/processthreadsapi/nf-processthreadsapi-createprocessw
-            if not shell and not isinstance(command, str):
-                executable = command[0]
-                new_command = [self.modules.shutil.which(executable) or executable]
-                new_command.extend(command[1:])
-                return new_command
-        else:
-            if not shell and isinstance(command, str):
-                return self.modules.shlex.split(command)
-
-        return command
+        return self.__format_for_subprocess(command, shell=shell)
 
     def exit_with_code(self, code: str | int | None) -> None:
         sys.exit(code)
@@ -78,12 +156,12 @@ class Platform:
         self, command: str | list[str], *, shell: bool = False, **kwargs: Any
     ) -> CompletedProcess:
         with self.capture_process(command, shell=shell, **kwargs) as process:
-            for line in self.stream_process_output(process):
-                self.__display_func(line, end='')
+            for chunk in self._stream_process_chunks(process):
+                self.__display_func(chunk, end='')
 
             stdout, stderr = process.communicate()
 
-        return self.modules.subprocess.CompletedProcess(process.args, process.poll(), stdout, stderr)
+        return self.subprocess.CompletedProcess(process.args, process.poll(), stdout, stderr)
 
     def run_command(self, command: str | list[str], *, shell: bool = False, **kwargs: Any) -> CompletedProcess:
         """
@@ -96,7 +174,7 @@ class Platform:
             return self._run_command_integrated(command, shell=shell, **kwargs)
 
         self.populate_default_popen_kwargs(kwargs, shell=shell)
-        return self.modules.subprocess.run(self.format_for_subprocess(command, shell=shell), shell=shell, **kwargs)
+        return self.subprocess.run(self.format_for_subprocess(command, shell=shell), shell=shell, **kwargs)
 
     def check_command(self, command: str | list[str], *, shell: bool = False, **kwargs: Any) -> CompletedProcess:
         """
@@ -132,44 +210,154 @@ class Platform:
         [properly formatted](utilities.md#hatch.utils.platform.Platform.format_for_subprocess).
         """
         self.populate_default_popen_kwargs(kwargs, shell=shell)
-        return self.modules.subprocess.Popen(
+        return self.subprocess.Popen(
             self.format_for_subprocess(command, shell=shell),
             shell=shell,
-            stdout=self.modules.subprocess.PIPE,
-            stderr=self.modules.subprocess.STDOUT,
+            stdout=self.subprocess.PIPE,
+            stderr=self.subprocess.STDOUT,
             **kwargs,
         )
 
     def populate_default_popen_kwargs(self, kwargs: dict[str, Any], *, shell: bool) -> None:
+        self.__populate_default_popen_kwargs(kwargs, shell=shell)
+
+    def _resolve_join_command_args(self, command_args: list[str]) -> str:
+        join_command_args: Callable[[list[str]], str]
+        if self.windows:
+            join_command_args = self.subprocess.list2cmdline
+        else:
+            try:
+                join_command_args = self.shlex.join
+            except AttributeError:
+                quote = self.shlex.quote
+
+                def join_command_args(command_args: list[str]) -> str:
+                    return ' '.join(map(quote, command_args))
+
+        self.join_command_args = join_command_args
+        return join_command_args(command_args)
+
+    def _format_for_subprocess_windows(self, command: str | list[str], *, shell: bool) -> str | list[str]:
+        # Manually locate executables on Windows to avoid multiple cases in which `shell=True` is required:
+        #
+        # - If the `PATH` environment variable has been modified, see:
+        #   https://github.com/python/cpython/issues/52803
+        # - Executables that do not have the extension `.exe`, see:
+        #   https://docs.microsoft.com/en-us/windows/win32/api/processthreadsapi/nf-processthreadsapi-createprocessw
+        if not shell and not isinstance(command, str):
+            executable = command[0]
+            resolved_executable = self._which(executable)
+            if resolved_executable is not None and resolved_executable != executable:
+                return [resolved_executable, *command[1:]]
+
+        return command
+
+    def _format_for_subprocess_posix(self, command: str | list[str], *, shell: bool) -> str | list[str]:
+        if not shell and isinstance(command, str):
+            return self.shlex.split(command)
+
+        return command
+
+    def _populate_default_popen_kwargs_macos(self, kwargs: dict[str, Any], *, shell: bool) -> None:
         # https://support.apple.com/en-us/HT204899
         # https://en.wikipedia.org/wiki/System_Integrity_Protection
-        if (
-            'executable' not in kwargs
-            and self.macos
-            and shell
-            and any(env_var.startswith(('DYLD_', 'LD_')) for env_var in os.environ)
-        ):
-            default_paths = os.environ.get('PATH', os.defpath).split(os.pathsep)
-            unprotected_paths = []
-            for path in default_paths:
-                normalized_path = os.path.normpath(path)
-                if not normalized_path.startswith(('/System', '/usr', '/bin', '/sbin', '/var')):
-                    unprotected_paths.append(path)
-                elif normalized_path.startswith('/usr/local'):
-                    unprotected_paths.append(path)
-
-            search_path = os.pathsep.join(unprotected_paths)
-            for exe_name in ('sh', 'bash', 'zsh', 'fish'):
-                executable = self.modules.shutil.which(exe_name, path=search_path)
-                if executable:
-                    kwargs['executable'] = executable
-                    break
+        if 'executable' not in kwargs and shell and any(env_var.startswith(('DYLD_', 'LD_')) for env_var in os.environ):
+            executable = self._find_sip_safe_shell(os.environ.get('PATH', os.defpath))
+            if executable:
+                kwargs['executable'] = executable
+
+    @staticmethod
+    def _populate_default_popen_kwargs_noop(kwargs: dict[str, Any], *, shell: bool) -> None:
+        pass
+
+    def _find_sip_safe_shell(self, path_env: str) -> str | None:
+        """
+        Locate a shell that is not subject to System Integrity Protection on macOS, as such executables
+        have `DYLD_*`/`LD_*` environment variables stripped.
+        """
+        search_path = _get_sip_unprotected_path(path_env)
+        for exe_name in _SHELL_CANDIDATES:
+            executable = self._which(exe_name, search_path)
+            if executable:
+                return executable
+
+        return None
+
+    def _which(self, executable: str, path: str | None = None) -> str | None:
+        """
+        Equivalent to the standard library's `shutil.which`, but successful lookups are cached based on everything
+        that may influence the result. Failed lookups are not cached as executables may be installed at any time.
+        """
+        if path is None:
+            path = os.environ.get('PATH', os.defpath)
+
+        # The current directory is searched first on Windows, as well as for relative executables or `PATH` entries
+        # on every platform, so only then does it influence the result
+        cwd = ''
+        if self.windows or _depends_on_cwd(executable, path):
+            try:
+                cwd = os.getcwd()
+            except OSError:
+                # The current directory may have been removed, in which case there is nothing to key the cache on
+                return self.shutil.which(executable, path=path)
+
+        # `PATHEXT` determines the candidate file names on Windows
+        key = (executable, path, os.environ.get('PATHEXT', ''), cwd)
+        resolved_executable = _which_cache.get(key)
+        if resolved_executable is None:
+            resolved_executable = self.shutil.which(executable, path=path)
+            if resolved_executable is not None:
+                if len(_which_cache) >= _WHICH_CACHE_SIZE:
+                    del _which_cache[next(iter(_which_cache))]
+
+                _which_cache[key] = resolved_executable
+
+        return resolved_executable
 
     @staticmethod
     def stream_process_output(process: Popen) -> Iterable[str]:
-        # To avoid blocking never use a pipe's file descriptor iterator. See https://bugs.python.org/issue3907
-        for line in iter(process.stdout.readline, b''):  # type: ignore
-            yield line.decode('utf-8')
+        # Let the C text layer decode output in chunks rather than decoding each line individually
+        stdout = io.TextIOWrapper(process.stdout, encoding='utf-8', newline='\n')  # type: ignore
+        try:
+            # To avoid blocking never use a pipe's file descriptor iterator. See https://bugs.python.org/issue3907
+            yield from iter(stdout.readline, '')
+        finally:
+            # Do not close the pipe when the wrapper is garbage collected, unless it was already closed
+            # while the generator was suspended e.g. by `communicate()` when aborting
+            if not stdout.closed:
+                stdout.detach()
+
+    @staticmethod
+    def _stream_process_chunks(process: Popen) -> Iterable[str]:
+        # Read whatever output is available up to a fixed size and emit all complete lines at once, which
+        # for bulk output requires far fewer iterations than going line by line. This never blocks waiting
+        # for more data than the pipe has available, see https://bugs.python.org/issue3907
+        decoder = codecs.getincrementaldecoder('utf-8')()
+        # Unbuffered pipes, i.e. `bufsize=0`, are raw streams whose `read` already returns whatever is available
+        stdout = process.stdout
+        read = stdout.read1 if hasattr(stdout, 'read1') else stdout.read  # type: ignore
+
+        # Only newly decoded text is searched for line boundaries, so partial lines are accumulated
+        # rather than repeatedly concatenated and rescanned
+        pending: list[str] = []
+        while True:
+            chunk = read(8192)
+            if not chunk:
+                break
+
+            text = decoder.decode(chunk)
+            boundary = text.rfind('\n') + 1
+            if boundary:
+                pending.append(text[:boundary])
+                yield ''.join(pending)
+                pending = [text[boundary:]]
+            else:
+                pending.append(text)
+
+        pending.append(decoder.decode(b'', final=True))
+        remaining = ''.join(pending)
+        if remaining:
+            yield remaining
 
     @property
     def default_shell(self) -> str:
@@ -187,52 +375,6 @@ class Platform:
                 self.__default_shell = cast(str, os.environ.get('SHELL', 'bash'))
         return self.__default_shell
 
-    @property
-    def join_command_args(self) -> Callable[[list[str]], str]:
-        if self.__join_command_args is None:
-            if self.windows:
-                self.__join_command_args = self.modules.subprocess.list2cmdline
-            else:
-                try:
-                    self.__join_command_args = self.modules.shlex.join
-                except AttributeError:
-                    self.__join_command_args = lambda command_args: ' '.join(
-                        map(self.modules.shlex.quote, command_args)
-                    )
-
-        return self.__join_command_args
-
-    @property
-    def format_file_uri(self) -> Callable[[str], str]:
-        if self.__format_file_uri is None:
-            if self.windows:
-                self.__format_file_uri = lambda p: f'file:///{p}'.replace('\\', '/')
-            else:
-                self.__format_file_uri = lambda p: f'file://{p}'
-
-        return self.__format_file_uri
-
-    @property
-    def windows(self) -> bool:
-        """
-        Indicates whether Hatch is running on Windows.
-        """
-        return self.name == 'windows'
-
-    @property
-    def macos(self) -> bool:
-        """
-        Indicates whether Hatch is running on macOS.
-        """
-        return self.name == 'macos'
-
-    @property
-    def linux(self) -> bool:
-        """
-        Indicates whether Hatch is running on neither Windows nor macOS.
-        """
-        return not (self.windows or self.macos)
-
     def exit_with_command(self, command: list[str]) -> None:
         """
         Run the given command and exit with its exit code. On non-Windows systems, this uses the standard library's
@@ -253,26 +395,41 @@ class Platform:
         - `windows`
         - `macos`
         """
-        if self.__name is None:
-            self.__name = get_platform_name()
-
         return self.__name
 
-    @property
-    def home(self) -> Path:
-        """
-        The user's home directory as a path-like object.
-        """
-        if self.__home is None:
-            from hatch.utils.fs import Path
 
-            self.__home = Path(os.path.expanduser('~'))
+def _format_file_uri_windows(path: str) -> str:
+    return f'file:///{path}'.replace('\\', '/')
+
 
-        return self.__home
+def _format_file_uri_posix(path: str) -> str:
+    return f'file://{path}'
+
+
+class _LazyModuleBinding:
+    """
+    Stands in for a module bound as an attribute of the owner, replacing itself with the actual module
+    upon first attribute access so that subsequent accesses are plain attribute lookups.
+    """
+
+    __slots__ = ('__name', '__owner')
+
+    def __init__(self, owner: Platform, name: str) -> None:
+        self.__owner = owner
+        self.__name = name
+
+    def __getattr__(self, attribute: str) -> Any:
+        module = getattr(self.__owner.modules, self.__name)
+        setattr(self.__owner, self.__name, module)
+        return getattr(module, attribute)
 
 
 class LazilyLoadedModules:
     def __getattr__(self, name: str) -> ModuleType:
-        module = import_module(name)
+        # Avoid the import machinery, and therefore the import lock, for modules that were already loaded elsewhere
+        module = sys.modules.get(name)
+        if module is None:
+            module = import_module(name)
+
         setattr(self, name, module)
         return module
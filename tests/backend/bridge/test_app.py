@@ -0,0 +1,41 @@
+import contextlib
+import io
+import pickle
+import sys
+
+from hatchling.bridge.app import InvokedApplication
+
+
+def parse_command(line):
+    indicator, _, procedure = line.partition(':')
+    assert indicator == '__HATCH__'
+
+    return pickle.loads(bytes.fromhex(procedure))  # noqa: S301
+
+
+class TestInvokedApplication:
+    def test_command_framing(self, capsysbinary):
+        InvokedApplication().display_info('foo', end='')
+
+        output = capsysbinary.readouterr().out.decode('ascii')
+        assert output.endswith('\n')
+        assert output.count('\n') == 1
+        assert parse_command(output.rstrip()) == ('display_info', ('foo',), {'end': ''})
+
+    def test_text_output_ordering(self, capsysbinary):
+        app = InvokedApplication()
+        sys.stdout.write('before\n')
+        app.display_info('foo')
+        sys.stdout.write('after\n')
+
+        lines = capsysbinary.readouterr().out.decode('ascii').splitlines()
+        assert lines[0] == 'before'
+        assert parse_command(lines[1]) == ('display_info', ('foo',), {})
+        assert lines[2] == 'after'
+
+    def test_stream_without_buffer(self):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            InvokedApplication().display_warning('foo')
+
+        assert parse_command(output.getvalue().rstrip()) == ('display_warning', ('foo',), {})
@@ -300,7 +300,9 @@ def mock_backend_process(request, mocker):
 
     mocker.patch('subprocess.Popen', side_effect=mock_process_api(subprocess.Popen))
     mocker.patch('subprocess.run', side_effect=mock_process_api(subprocess.run))
-    mocker.patch('hatchling.bridge.app._send_app_command', side_effect=lambda cmd: line_queue.append(f'{cmd}\n'))
+    mocker.patch(
+        'hatchling.bridge.app._send_app_command', side_effect=lambda cmd: line_queue.append(f'{cmd.decode()}\n')
+    )
 
     yield True
 
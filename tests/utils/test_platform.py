@@ -1,10 +1,15 @@
 import os
+import shlex
+import shutil
 import stat
+import subprocess
+import sys
+from io import BytesIO
 
 import pytest
 
 from hatch.utils.fs import Path
-from hatch.utils.platform import Platform
+from hatch.utils.platform import _WHICH_CACHE_SIZE, Platform, _get_sip_unprotected_path, _which_cache
 from hatch.utils.structures import EnvVars
 
 
@@ -33,6 +38,12 @@ class TestWindows:
 
         assert platform.home == platform.home == Path(os.path.expanduser('~'))
 
+    def test_join_command_args(self):
+        platform = Platform()
+
+        assert platform.join_command_args(['foo', 'bar baz']) == platform.join_command_args(['foo', 'bar baz'])
+        assert platform.join_command_args(['foo', 'bar baz']) == 'foo "bar baz"'
+
     def test_populate_default_popen_kwargs_executable(self):
         platform = Platform()
 
@@ -70,6 +81,12 @@ class TestMacOS:
 
         assert platform.home == platform.home == Path(os.path.expanduser('~'))
 
+    def test_join_command_args(self):
+        platform = Platform()
+
+        assert platform.join_command_args(['foo', 'bar baz']) == platform.join_command_args(['foo', 'bar baz'])
+        assert platform.join_command_args(['foo', 'bar baz']) == "foo 'bar baz'"
+
     def test_populate_default_popen_kwargs_executable(self, temp_dir):
         new_path = f'{os.environ.get("PATH", "")}{os.pathsep}{temp_dir}'.strip(os.pathsep)
         executable = temp_dir / 'sh'
@@ -110,6 +127,17 @@ class TestLinux:
 
         assert platform.home == platform.home == Path(os.path.expanduser('~'))
 
+    def test_join_command_args(self):
+        platform = Platform()
+
+        assert platform.join_command_args(['foo', 'bar baz']) == platform.join_command_args(['foo', 'bar baz'])
+        assert platform.join_command_args(['foo', 'bar baz']) == "foo 'bar baz'"
+
+    def test_join_command_args_without_shlex_join(self, monkeypatch):
+        monkeypatch.delattr(shlex, 'join', raising=False)
+
+        assert Platform().join_command_args(['foo', 'bar baz']) == "foo 'bar baz'"
+
     def test_populate_default_popen_kwargs_executable(self):
         platform = Platform()
 
@@ -120,3 +148,197 @@ class TestLinux:
         kwargs['executable'] = 'foo'
         platform.populate_default_popen_kwargs(kwargs, shell=True)
         assert kwargs['executable'] == 'foo'
+
+
+class TestModules:
+    def test_bound_on_first_access(self):
+        platform = Platform()
+
+        assert platform.shlex.split('foo bar') == ['foo', 'bar']
+        assert platform.shlex is shlex
+        assert platform.shutil.which is shutil.which
+        assert platform.shutil is shutil
+        assert platform.subprocess.PIPE == subprocess.PIPE
+        assert platform.subprocess is subprocess
+
+
+class TestSubprocessOverrides:
+    def test_run_command(self, mocker):
+        platform = Platform()
+        format_for_subprocess = mocker.patch.object(Platform, 'format_for_subprocess', return_value=['foo'])
+        populate_default_popen_kwargs = mocker.patch.object(Platform, 'populate_default_popen_kwargs')
+        run = mocker.patch('subprocess.run')
+
+        platform.run_command('bar', shell=True)
+
+        format_for_subprocess.assert_called_once_with('bar', shell=True)
+        populate_default_popen_kwargs.assert_called_once_with({}, shell=True)
+        run.assert_called_once_with(['foo'], shell=True)
+
+    def test_capture_process(self, mocker):
+        platform = Platform()
+        format_for_subprocess = mocker.patch.object(Platform, 'format_for_subprocess', return_value=['foo'])
+        populate_default_popen_kwargs = mocker.patch.object(Platform, 'populate_default_popen_kwargs')
+        popen = mocker.patch('subprocess.Popen')
+
+        platform.capture_process('bar', shell=True)
+
+        format_for_subprocess.assert_called_once_with('bar', shell=True)
+        populate_default_popen_kwargs.assert_called_once_with({}, shell=True)
+        popen.assert_called_once_with(['foo'], shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+
+
+@pytest.mark.requires_unix
+class TestSIPUnprotectedPath:
+    def test_filtering(self):
+        path_env = os.pathsep.join(
+            ['/usr/bin', '/usr/local/bin', '/opt/foo/bin', '/bin', '/System/bar', '/sbin/../baz']
+        )
+
+        assert _get_sip_unprotected_path(path_env) == os.pathsep.join(
+            ['/usr/local/bin', '/opt/foo/bin', '/sbin/../baz']
+        )
+
+    def test_computed_once_per_path(self, mocker):
+        _get_sip_unprotected_path.cache_clear()
+        normpath = mocker.spy(os.path, 'normpath')
+        path_env = os.pathsep.join(['/usr/bin', '/opt/foo/bin'])
+
+        assert _get_sip_unprotected_path(path_env) == _get_sip_unprotected_path(path_env) == '/opt/foo/bin'
+        assert normpath.call_count == 2
+
+        assert _get_sip_unprotected_path('/opt/bar/bin') == '/opt/bar/bin'
+        assert normpath.call_count == 3
+
+
+@pytest.mark.requires_unix
+class TestWhich:
+    @staticmethod
+    def create_executable(directory, name):
+        executable = directory / name
+        executable.touch()
+        executable.chmod(executable.stat().st_mode | stat.S_IEXEC)
+        return executable
+
+    def test_failed_lookup_not_cached(self, temp_dir):
+        platform = Platform()
+        assert platform._which('foo', str(temp_dir)) is None
+
+        executable = self.create_executable(temp_dir, 'foo')
+        assert platform._which('foo', str(temp_dir)) == str(executable)
+
+    def test_path_change_misses_cache(self, temp_dir):
+        first_dir = temp_dir / 'first'
+        first_dir.mkdir()
+        second_dir = temp_dir / 'second'
+        second_dir.mkdir()
+        first_executable = self.create_executable(first_dir, 'foo')
+        second_executable = self.create_executable(second_dir, 'foo')
+
+        platform = Platform()
+        assert platform._which('foo', str(first_dir)) == str(first_executable)
+        assert platform._which('foo', str(second_dir)) == str(second_executable)
+        assert platform._which('foo', f'{first_dir}{os.pathsep}{second_dir}') == str(first_executable)
+
+    def test_relative_path_entry_keyed_on_cwd(self, temp_dir):
+        first_dir = temp_dir / 'first'
+        (first_dir / 'bin').ensure_dir_exists()
+        second_dir = temp_dir / 'second'
+        (second_dir / 'bin').ensure_dir_exists()
+        first_executable = self.create_executable(first_dir / 'bin', 'foo')
+        second_executable = self.create_executable(second_dir / 'bin', 'foo')
+
+        platform = Platform()
+        with first_dir.as_cwd():
+            assert os.path.samefile(platform._which('foo', 'bin'), first_executable)
+        with second_dir.as_cwd():
+            assert os.path.samefile(platform._which('foo', 'bin'), second_executable)
+
+    def test_current_directory_removed(self, temp_dir):
+        executable = self.create_executable(temp_dir, 'foo')
+        removed_dir = temp_dir / 'removed'
+        removed_dir.mkdir()
+
+        platform = Platform()
+        with removed_dir.as_cwd():
+            removed_dir.rmdir()
+
+            assert platform._which('foo', str(temp_dir)) == str(executable)
+            assert platform._which('foo', 'bin') is None
+
+    def test_cache_bounded(self, temp_dir):
+        self.create_executable(temp_dir, 'foo')
+
+        platform = Platform()
+        for i in range(_WHICH_CACHE_SIZE + 1):
+            platform._which('foo', f'{temp_dir}{os.pathsep * i}')
+
+        assert len(_which_cache) == _WHICH_CACHE_SIZE
+
+
+class TestStreamProcessOutput:
+    def test_lines(self, mocker):
+        process = mocker.MagicMock()
+        process.stdout = BytesIO('foo\r\nbar\rbaz\n\u00e9'.encode('utf-8'))
+
+        assert list(Platform.stream_process_output(process)) == ['foo\r\n', 'bar\rbaz\n', '\u00e9']
+        assert not process.stdout.closed
+
+    def test_pipe_closed_before_exhausted(self, mocker):
+        process = mocker.MagicMock()
+        process.stdout = BytesIO(b'foo\nbar\n')
+
+        lines = Platform.stream_process_output(process)
+        assert next(lines) == 'foo\n'
+
+        process.stdout.close()
+        lines.close()
+
+
+class ChunkedOutput:
+    def __init__(self, chunks):
+        self.chunks = iter(chunks)
+
+    def read1(self, size):
+        return next(self.chunks, b'')
+
+
+class TestStreamProcessChunks:
+    @staticmethod
+    def stream(mocker, chunks):
+        process = mocker.MagicMock()
+        process.stdout = ChunkedOutput(chunks)
+        return list(Platform._stream_process_chunks(process))
+
+    def test_complete_lines(self, mocker):
+        assert self.stream(mocker, [b'foo\nbar\n', b'baz\n']) == ['foo\nbar\n', 'baz\n']
+
+    def test_partial_lines(self, mocker):
+        assert self.stream(mocker, [b'foo\nba', b'r', b'\nbaz\n']) == ['foo\n', 'bar\nbaz\n']
+
+    def test_no_newlines(self, mocker):
+        assert self.stream(mocker, [b'10%\r', b'50%\r', b'100%\r']) == ['10%\r50%\r100%\r']
+
+    def test_split_utf8_sequence(self, mocker):
+        encoded = '\u00e9\n'.encode('utf-8')
+
+        assert self.stream(mocker, [b'foo ' + encoded[:1], encoded[1:]]) == ['foo \u00e9\n']
+
+    def test_trailing_text(self, mocker):
+        assert self.stream(mocker, [b'foo\nbar', b' baz']) == ['foo\n', 'bar baz']
+
+    def test_empty(self, mocker):
+        assert self.stream(mocker, []) == []
+
+    @pytest.mark.parametrize('bufsize', [-1, 0])
+    def test_run_command_integrated(self, bufsize):
+        output = []
+        platform = Platform(lambda text, end: output.append(text))
+        platform.displaying_status = True
+
+        process = platform.run_command(
+            [sys.executable, '-c', "import sys; sys.stdout.write('foo\\nbar\\nbaz')"], bufsize=bufsize
+        )
+
+        assert process.returncode == 0
+        assert ''.join(output) == 'foo\nbar\nbaz'